@@ -0,0 +1,126 @@
+# ------------- 👋 Welcome to the hook for sharing assets across language sites -------------#
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+# The language sites are built from repos where `images`, `js` and `.snippets/code` are      #
+# symlinks into the English `moonbeam-docs` repo, so everything they would copy into their   #
+# static directory is already served by the English site. The `images/` and `js/` folders    #
+# are left out of language builds through `exclude_docs`, and this hook takes care of the    #
+# rest:                                                                                      #
+#   - references to shared assets under the language prefix (i.e. `/cn/assets/`) are         #
+#     rewritten to the English site's absolute path while each page is rendered              #
+#   - protocol-relative links (`href="//...`, `src="//...`) are rewritten to `https://`      #
+#   - once the build is done, any remaining file that is identical to the one at the same    #
+#     path in the English static directory is replaced with a hard link to it                #
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+# To use the hook, add it to the `hooks` section of the language `mkdocs.yml` and set the    #
+# English static directory and the shared folders under `extra.shared_assets`:               #
+#                                                                                            #
+#   hooks:                                                                                   #
+#     - hooks/shared_assets.py                                                               #
+#   extra:                                                                                   #
+#     shared_assets:                                                                         #
+#       site_dir: /var/www/moonbeam-docs-static                                              #
+#       dirs: [assets, images, js]                                                           #
+#                                                                                            #
+# Hard links rely on both sites being built with `mkdocs build --clean` (as `git_sync` and   #
+# `git_sync_ml` do), so a rebuild always writes new files instead of truncating shared ones. #
+# That also leaves language sites linked to deleted copies after an English rebuild, so      #
+# `git_sync` builds en first and runs this script to link again any site it did not rebuild. #
+
+import errno
+import filecmp
+import logging
+import os
+import re
+from urllib.parse import urlsplit
+
+log = logging.getLogger("mkdocs.hooks.shared_assets")
+
+shared_site_dir = None
+shared_refs = None
+
+
+def on_config(config):
+    global shared_site_dir, shared_refs
+
+    options = config.extra.get("shared_assets") or {}
+    shared_site_dir = options.get("site_dir")
+    dirs = options.get("dirs") or ["assets", "images", "js"]
+
+    # Match `href="/cn/assets/` and friends, the language prefix comes from the site_url
+    prefix = urlsplit(config.site_url or "").path.strip("/")
+    if prefix:
+        shared_refs = re.compile(
+            r'(href|src)="/' + re.escape(prefix) + r"/(" + "|".join(map(re.escape, dirs)) + r")/"
+        )
+    else:
+        shared_refs = None
+    return config
+
+
+# Protocol-relative external links, served over HTTPS only
+external_refs = re.compile(r'(href|src)="//')
+
+
+def rewrite_shared_refs(output):
+    output = external_refs.sub(r'\1="https://', output)
+    if shared_refs is None:
+        return output
+    return shared_refs.sub(r'\1="/\2/', output)
+
+
+def on_post_page(output, page, config):
+    return rewrite_shared_refs(output)
+
+
+def on_post_template(output_content, template_name, config):
+    return rewrite_shared_refs(output_content)
+
+
+def on_post_build(config):
+    link_shared_files(config.site_dir, shared_site_dir)
+
+
+def link_shared_files(site_dir, shared_site_dir):
+    if not shared_site_dir or not os.path.isdir(shared_site_dir):
+        log.warning("Shared site_dir not found, skipping hard links: %s", shared_site_dir)
+        return
+
+    linked = 0
+    saved = 0
+    for root, dirs, files in os.walk(site_dir):
+        for file in files:
+            file_path = os.path.join(root, file)
+            shared_path = os.path.join(shared_site_dir, os.path.relpath(file_path, site_dir))
+            if os.path.islink(file_path) or not os.path.isfile(shared_path):
+                continue
+
+            stat = os.stat(file_path)
+            shared_stat = os.stat(shared_path)
+            if stat.st_ino == shared_stat.st_ino and stat.st_dev == shared_stat.st_dev:
+                continue
+            if stat.st_size != shared_stat.st_size or not filecmp.cmp(file_path, shared_path, shallow=False):
+                continue
+
+            # Link next to the target first so the swap is atomic
+            tmp_path = file_path + ".shared-link"
+            try:
+                os.link(shared_path, tmp_path)
+            except OSError as e:
+                if e.errno == errno.EXDEV:
+                    log.warning("Static dirs are on different filesystems, skipping hard links")
+                    return
+                raise
+            os.replace(tmp_path, file_path)
+            linked += 1
+            saved += stat.st_size
+
+    log.info("Hard linked %d shared files (%.1f MB)", linked, saved / (1024 * 1024))
+
+
+# The English build replaces every file, so `git_sync` links the language sites again
+# when it rebuilds en without them: `python hooks/shared_assets.py <site_dir> <shared_site_dir>`
+if __name__ == "__main__":
+    import sys
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    link_shared_files(sys.argv[1], sys.argv[2])
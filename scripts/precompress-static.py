@@ -0,0 +1,146 @@
+# --------------- 👋 Welcome to the script for precompressing the static sites ---------------#
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+# The purpose of this script is to write `.gz` and `.br` siblings next to every HTML, JS,    #
+# CSS, JSON and JSONL file of a built static site, so the web server can serve them as-is    #
+# (`gzip_static` / `brotli_static`) instead of compressing large files like                  #
+# `search_index.json` and `llms-full.jsonl` on every request. Compressed files are kept in   #
+# a cache directory keyed by the sha256 of their source, so files whose content did not      #
+# change since the last build are linked back into place instead of being compressed again. #
+# Siblings whose source file is gone are removed, as are cache entries no site uses anymore. #
+# Brotli output requires the `brotli` package. It is not part of `requirements.txt` (used by #
+# the GitHub Pages deploy, which doesn't run this script), so install it on the server into  #
+# the Python environment mkdocs runs from with `pip install Brotli`. `git_sync` and          #
+# `git_sync_ml` call the script with the interpreter of `/usr/local/bin/mkdocs`. Without     #
+# `brotli` the script exits with an error and leaves the existing output untouched.          #
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+# The script runs after every build from `git_sync` and `git_sync_ml`, but it can also be    #
+# run by hand passing in one or more static site directories:                                #
+# `python scripts/precompress-static.py /var/www/moonbeam-docs-static`                       #
+
+import os
+import sys
+import gzip
+import json
+import errno
+import shutil
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+cache_dir = os.environ.get("PRECOMPRESS_CACHE", "/var/cache/moonbeam-docs-precompress")
+extensions = (".html", ".js", ".css", ".json", ".jsonl")
+# anything smaller fits in a single packet, compressing it is not worth it
+min_size = 256
+
+compressors = {
+    ".gz": lambda data: gzip.compress(data, compresslevel=9, mtime=0),
+    ".br": lambda data: brotli.compress(data, quality=11),
+}
+
+
+def link_into_place(source, destination):
+    if os.path.exists(destination) and os.path.samefile(source, destination):
+        return
+    tmp_path = destination + ".tmp"
+    try:
+        os.link(source, tmp_path)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.copyfile(source, tmp_path)
+    os.replace(tmp_path, destination)
+
+
+def precompress_file(file_path):
+    with open(file_path, "rb") as f:
+        data = f.read()
+    digest = hashlib.sha256(data).hexdigest()
+
+    compressed = False
+    for ext, compress in compressors.items():
+        blob_path = os.path.join(cache_dir, digest[:2], digest + ext)
+        if not os.path.exists(blob_path):
+            os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+            tmp_path = blob_path + "." + str(os.getpid())
+            with open(tmp_path, "wb") as f:
+                f.write(compress(data))
+            os.replace(tmp_path, blob_path)
+            compressed = True
+        link_into_place(blob_path, file_path + ext)
+
+    return file_path, digest, compressed
+
+
+def precompress_site(site_dir):
+    sources = []
+    siblings = []
+    for root, dirs, files in os.walk(site_dir):
+        for file in files:
+            file_path = os.path.join(root, file)
+            if file.endswith(extensions) and os.path.getsize(file_path) >= min_size:
+                sources.append(file_path)
+            elif file.endswith((".gz", ".br")) and file[:-3].endswith(extensions):
+                siblings.append(file_path)
+
+    manifest = {}
+    compressed = 0
+    with ProcessPoolExecutor() as executor:
+        for file_path, digest, is_new in executor.map(precompress_file, sources, chunksize=64):
+            manifest[os.path.relpath(file_path, site_dir)] = digest
+            if is_new:
+                compressed += 1
+
+    # Remove siblings of files that no longer exist or are not compressed anymore
+    current = set(sources)
+    stale = [s for s in siblings if s[:-3] not in current or s[-3:] not in compressors]
+    for sibling in stale:
+        os.remove(sibling)
+
+    manifest_path = os.path.join(cache_dir, site_dir.strip("/").replace("/", "_") + ".json")
+    with open(manifest_path, "w") as output_file:
+        json.dump(manifest, output_file, indent=4)
+
+    print(
+        f"✅ Precompressed {site_dir}: {len(sources)} files, {compressed} compressed, "
+        f"{len(sources) - compressed} unchanged, {len(stale)} stale siblings removed"
+    )
+
+
+def prune_cache():
+    # Keep every blob still referenced by the manifest of any site
+    referenced = set()
+    for file in os.listdir(cache_dir):
+        if file.endswith(".json"):
+            with open(os.path.join(cache_dir, file)) as f:
+                referenced.update(json.load(f).values())
+
+    removed = 0
+    for root, dirs, files in os.walk(cache_dir):
+        if root == cache_dir:
+            continue
+        for file in files:
+            if file.split(".")[0] not in referenced:
+                os.remove(os.path.join(root, file))
+                removed += 1
+    if removed:
+        print(f"✅ Removed {removed} unused files from {cache_dir}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python scripts/precompress-static.py <site_dir> [<site_dir> ...]")
+        sys.exit(1)
+
+    # Exit before touching anything, otherwise every .br sibling would be removed as stale
+    if brotli is None:
+        print("❌ brotli is not installed, run `pip install Brotli` for " + sys.executable)
+        sys.exit(1)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    for site_dir in sys.argv[1:]:
+        precompress_site(os.path.abspath(site_dir))
+    prune_cache()
@@ -0,0 +1,227 @@
+# ------------ 👋 Welcome to the script for finding outdated translated sections ------------#
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+# The purpose of this script is to list which sections of which English pages changed since  #
+# the language repo was last synced, so translators only need to review those sections       #
+# instead of diffing whole files. It works by splitting every page in `moonbeam-docs` at the #
+# `{: #id }` header attributes (see `create-header-attributes.py`), hashing each section and #
+# comparing the hashes with the ones recorded at the last sync in                            #
+# `scripts/section-hashes/<lang>.json`. Content before the first header is tracked as the    #
+# `intro` section. Section hashes are cached in `scripts/section-hashes/.cache.json` along   #
+# with the size and modification time of each page, so only pages that were touched since    #
+# the last run are read again. Text snippets in `.snippets/text` are indexed the same way    #
+# as `.snippets/text/<file>` entries, and the pages including a changed snippet through      #
+# `--8<--` are listed below it. Code snippets are shared with the language repos, so they    #
+# are skipped.                                                                               #
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
+# To use the script, ensure that the `moonbeam-docs` repo is nestled inside of your local    #
+# `moonbeam-mkdocs` repo and on the branch you want to compare. Run                          #
+# `python scripts/section-hashes.py` to list the changed sections for the Chinese repo, or   #
+# pass in a language (i.e. `python scripts/section-hashes.py cn`). Once the translations are #
+# synced, run `python scripts/section-hashes.py --record` to save the current hashes as the  #
+# new baseline and commit the updated `scripts/section-hashes/<lang>.json` file.             #
+
+import os
+import re
+import sys
+import json
+import hashlib
+
+docs_dir = "moonbeam-docs"
+hashes_dir = "scripts/section-hashes/"
+cache_path = hashes_dir + ".cache.json"
+omit_dirs = ["js", "images"]
+# Code snippets are shared with the language repos, text snippets are translated
+snippets_dir = ".snippets"
+snippets_text_dir = "text"
+
+header_regex = re.compile(r"^#{2,6} .*\{: #([^ }]+) \}\s*$")
+fence_regex = re.compile(r"^\s*(`{3,}|~{3,})(.*)$")
+# `--8<-- "text/file.md"`, optionally followed by lines or a section (`:1:5`)
+snippet_regex = re.compile(r"^\s*-{1,}8<-{1,}\s+[\"']([^\"':]+)")
+snippet_block_regex = re.compile(r"^\s*-{1,}8<-{1,}\s*$")
+
+
+def split_sections(content):
+    sections = {}
+    section_id = "intro"
+    lines = []
+    # Opening marker of the current code block, only a matching one closes it
+    fence = None
+
+    for line in content.splitlines():
+        fence_match = fence_regex.match(line)
+        if fence_match:
+            marker = fence_match.group(1)
+            if fence is None:
+                fence = marker
+            elif marker[0] == fence[0] and len(marker) >= len(fence) and not fence_match.group(2).strip():
+                fence = None
+        match = None if fence else header_regex.match(line)
+        if match:
+            sections[section_id] = lines
+            section_id = match.group(1)
+            # Headers can repeat within a page, keep every section
+            count = 2
+            while section_id in sections:
+                section_id = match.group(1) + "-" + str(count)
+                count += 1
+            lines = []
+        lines.append(line.rstrip())
+    sections[section_id] = lines
+
+    hashes = {}
+    for section_id, lines in sections.items():
+        text = "\n".join(lines).strip()
+        if text or section_id != "intro":
+            hashes[section_id] = hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+    return hashes
+
+
+def find_snippets(content):
+    snippets = []
+    in_block = False
+    for line in content.splitlines():
+        if snippet_block_regex.match(line):
+            in_block = not in_block
+            continue
+        match = snippet_regex.match(line)
+        if match:
+            path = match.group(1)
+        elif in_block and line.strip():
+            path = line.strip().split(":")[0]
+        else:
+            continue
+        path = os.path.join(snippets_dir, path.strip())
+        if path not in snippets:
+            snippets.append(path)
+    return snippets
+
+
+def include_dir(root, d):
+    if root == docs_dir:
+        return d == snippets_dir or (not d.startswith(".") and d not in omit_dirs)
+    if root == os.path.join(docs_dir, snippets_dir):
+        return d == snippets_text_dir
+    return not d.startswith(".")
+
+
+def build_index(cache):
+    index = {}
+    for root, dirs, files in os.walk(docs_dir):
+        # Skip hidden directories (i.e. .git, .snippets/code) and assets, but keep text snippets
+        dirs[:] = sorted(d for d in dirs if include_dir(root, d))
+        for file in sorted(files):
+            in_snippets = root.startswith(os.path.join(docs_dir, snippets_dir))
+            # Every text snippet is indexed, not just the Markdown ones
+            if in_snippets and root == os.path.join(docs_dir, snippets_dir):
+                continue
+            if not in_snippets and (not file.endswith(".md") or (root == docs_dir and file == "README.md")):
+                continue
+            file_path = os.path.join(root, file)
+            page = os.path.relpath(file_path, docs_dir)
+            stat = os.stat(file_path)
+
+            cached = cache.get(page)
+            if cached and "snippets" not in cached:
+                cached = None
+            if cached and cached["size"] == stat.st_size and cached["mtime"] == stat.st_mtime_ns:
+                index[page] = cached
+                continue
+
+            with open(file_path, "rb") as f:
+                data = f.read()
+            file_hash = hashlib.sha256(data).hexdigest()
+            # The file might just have been touched (i.e. by a checkout)
+            if cached and cached["hash"] == file_hash:
+                sections = cached["sections"]
+                snippets = cached["snippets"]
+            else:
+                content = data.decode("utf-8", errors="replace")
+                sections = split_sections(content)
+                snippets = find_snippets(content)
+            index[page] = {
+                "size": stat.st_size,
+                "mtime": stat.st_mtime_ns,
+                "hash": file_hash,
+                "sections": sections,
+                "snippets": snippets,
+            }
+    return index
+
+
+def find_includes(index, snippet):
+    # Pages including the snippet, directly or through other snippets
+    includes = []
+    pending = [snippet]
+    while pending:
+        path = pending.pop()
+        for page, entry in index.items():
+            if path in entry["snippets"] and page not in includes:
+                includes.append(page)
+                pending.append(page)
+    return sorted(p for p in includes if not p.startswith(snippets_dir + "/"))
+
+
+def compare(previous, current):
+    changes = []
+    for page in sorted(set(previous) | set(current)):
+        if page not in previous:
+            changes.append((page, "added page", []))
+            continue
+        if page not in current:
+            changes.append((page, "removed page", []))
+            continue
+
+        prev_sections = previous[page]
+        curr_sections = current[page]
+        if prev_sections == curr_sections:
+            continue
+        changed = [s for s in curr_sections if s in prev_sections and curr_sections[s] != prev_sections[s]]
+        added = [s for s in curr_sections if s not in prev_sections]
+        removed = [s for s in prev_sections if s not in curr_sections]
+        details = ["~ " + s for s in changed] + ["+ " + s for s in added] + ["- " + s for s in removed]
+        changes.append((page, "changed sections", details))
+    return changes
+
+
+record = "--record" in sys.argv[1:]
+args = [arg for arg in sys.argv[1:] if arg != "--record"]
+lang = args[0] if args else "cn"
+baseline_path = hashes_dir + lang + ".json"
+
+cache = {}
+if os.path.exists(cache_path):
+    with open(cache_path) as f:
+        cache = json.load(f)
+
+print("✅ Hashing page sections")
+index = build_index(cache)
+os.makedirs(hashes_dir, exist_ok=True)
+with open(cache_path, "w") as output_file:
+    json.dump(index, output_file)
+
+current = {page: entry["sections"] for page, entry in index.items()}
+
+if record:
+    with open(baseline_path, "w") as output_file:
+        json.dump(current, output_file, indent=4, sort_keys=True)
+    print("✅ Recorded section hashes for " + str(len(current)) + " pages in " + baseline_path)
+    sys.exit()
+
+if not os.path.exists(baseline_path):
+    print("❌ No section hashes recorded for " + lang + ", run with --record after the next sync")
+    sys.exit(1)
+
+with open(baseline_path) as f:
+    previous = json.load(f)
+
+changes = compare(previous, current)
+for page, status, details in changes:
+    print("📄 " + page + " (" + status + ")")
+    for detail in details:
+        print("    " + detail)
+    if page.startswith(snippets_dir + "/"):
+        for include in find_includes(index, page):
+            print("    ↳ included in " + include)
+
+print("✅ " + str(len(changes)) + " of " + str(len(current)) + " pages changed since the last " + lang + " sync")